@@ -3,7 +3,17 @@
 # How long to wait for a response from the BlueConnect Go device, in seconds
 NOTIFY_TIMEOUT = 15
 
+# How long to keep the connection open after a request, in seconds. This only
+# lets back-to-back requests (e.g. a button press right after a poll) skip the
+# reconnect; scheduled polls are far apart and always connect afresh, so keep it
+# short to avoid holding the battery-powered device and the adapter slot.
+CLIENT_IDLE_TIMEOUT = 10
+
 # BLE characteristic to request sensor reading
 BUTTON_CHAR_UUID = "F3300002-F0A2-9B06-0C59-1BC4763B5C00"
 # BLE characteristic to wait for sensor readings on
 NOTIFY_CHAR_UUID = "F3300003-F0A2-9B06-0C59-1BC4763B5C00"
+
+# Battery voltage range, in millivolts, mapped to 0-100 %
+BATT_MAX_MV = 3640
+BATT_MIN_MV = 3400
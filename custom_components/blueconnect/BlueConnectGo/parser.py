@@ -5,20 +5,82 @@ from __future__ import annotations
 import asyncio
 from asyncio import Event
 import dataclasses
-from functools import partial
 import logging
 from logging import Logger
+import struct
 
 from bleak import BleakClient
 from bleak.backends.device import BLEDevice
 from bleak_retry_connector import establish_connection
 
-from .const import BUTTON_CHAR_UUID, NOTIFY_CHAR_UUID, NOTIFY_TIMEOUT
+from .const import (
+    BATT_MAX_MV,
+    BATT_MIN_MV,
+    BUTTON_CHAR_UUID,
+    CLIENT_IDLE_TIMEOUT,
+    NOTIFY_CHAR_UUID,
+    NOTIFY_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status frame: one header byte followed by little-endian uint16 readings for
+# temperature, pH, ORP, conductivity and battery voltage
+_STATUS_FRAME = struct.Struct("<HHHHH")
 
-@dataclasses.dataclass
+# Precomputed scale factors so frame decoding only needs multiplications
+_TEMP_SCALE = 0.01
+_PH_CENTER = 2048
+_PH_SCALE = 1.0 / 232.0
+_PH_OFFSET = 7.0
+_ORP_SCALE = 0.25
+_ORP_OFFSET = 5.0
+_CHLORINE_ORP_ZERO = 650.0
+_CHLORINE_SCALE = 10.0 / 200.0
+_EC_FACTOR = 1.0615 / 0.000001
+_EC_TO_SALT = 500.0 / 1000.0 * 0.001
+_BATT_SCALE = 100.0 / (BATT_MAX_MV - BATT_MIN_MV)
+
+
+def _parse_status_frame(
+    data: bytes | bytearray,
+) -> tuple[float, float, float, float, float | None, float | None, int]:
+    """Decode the sensor readings carried by a status frame."""
+    # TODO: All these readings need to be reviewed and improved
+
+    raw_temp, raw_ph, raw_orp, raw_cond, raw_batt = _STATUS_FRAME.unpack_from(data, 1)
+
+    temperature = raw_temp * _TEMP_SCALE
+    ph = (_PH_CENTER - raw_ph) * _PH_SCALE + _PH_OFFSET
+
+    # orp = raw_orp / 3.86 - 21.57826
+    orp = raw_orp * _ORP_SCALE - _ORP_OFFSET
+    chlorine = (orp - _CHLORINE_ORP_ZERO) * _CHLORINE_SCALE
+
+    if raw_cond != 0:
+        ec = _EC_FACTOR / raw_cond
+        salt = ec * _EC_TO_SALT
+    else:
+        ec = None
+        salt = None
+
+    return temperature, ph, orp, chlorine, ec, salt, raw_batt
+
+
+def _battery_percent(raw_batt: int) -> float:
+    """Convert a battery voltage in millivolts to a charge percentage."""
+    batt_percent = (raw_batt - BATT_MIN_MV) * _BATT_SCALE
+    return max(0.0, min(batt_percent, 100.0))
+
+
+def _clear_readings(device: BlueConnectGoDevice) -> None:
+    """Mark every reading as missing, keeping the dict's key set intact."""
+    sensors = device.sensors
+    for key in sensors:
+        sensors[key] = None
+
+
+@dataclasses.dataclass(slots=True)
 class BlueConnectGoDevice:
     """Response data with information about the Blue Connect Go device."""
 
@@ -37,9 +99,6 @@ class BlueConnectGoDevice:
 class BlueConnectGoBluetoothDeviceData:
     """Data for Blue Connect Go BLE sensors."""
 
-    _event: asyncio.Event | None
-    _command_data: bytearray | None
-
     def __init__(
         self,
         logger: Logger,
@@ -48,6 +107,68 @@ class BlueConnectGoBluetoothDeviceData:
         super().__init__()
         self.logger = logger
         self.logger.debug("In Device Data")
+        self._client: BleakClient | None = None
+        self._client_lock = asyncio.Lock()
+        self._disconnect_timer: asyncio.TimerHandle | None = None
+        self._disconnect_task: asyncio.Task | None = None
+        self._pending: tuple[BlueConnectGoDevice, Event] | None = None
+        self._device: BlueConnectGoDevice | None = None
+        self._last_raw_batt = -1
+        self._battery: float = 0.0
+
+    async def _ensure_connected(self, ble_device: BLEDevice) -> BleakClient:
+        """Return a connected client, reusing the previous one if still up."""
+        if self._client is not None and self._client.is_connected:
+            _LOGGER.debug("Reusing Client")
+            return self._client
+
+        client = await establish_connection(
+            BleakClient, ble_device, ble_device.address
+        )
+        _LOGGER.debug("Got Client")
+        try:
+            await client.start_notify(NOTIFY_CHAR_UUID, self._receive_status)
+        except BaseException:
+            # Also on cancellation, so no connected client is left unreferenced
+            await client.disconnect()
+            raise
+        self._client = client
+        return client
+
+    def _cancel_disconnect_timer(self) -> None:
+        if self._disconnect_timer is not None:
+            self._disconnect_timer.cancel()
+            self._disconnect_timer = None
+
+    def _schedule_disconnect(self) -> None:
+        self._cancel_disconnect_timer()
+        self._disconnect_timer = asyncio.get_running_loop().call_later(
+            CLIENT_IDLE_TIMEOUT, self._on_idle_timeout
+        )
+
+    def _on_idle_timeout(self) -> None:
+        _LOGGER.debug("Client idle, disconnecting")
+        self._disconnect_timer = None
+        self._disconnect_task = asyncio.get_running_loop().create_task(
+            self._idle_disconnect()
+        )
+
+    async def _idle_disconnect(self) -> None:
+        try:
+            await self.disconnect()
+        except Exception as err:  # pylint: disable=broad-except  # noqa: BLE001
+            _LOGGER.debug("Error disconnecting idle client: %s", err)
+
+    async def _disconnect(self) -> None:
+        self._cancel_disconnect_timer()
+        client, self._client = self._client, None
+        if client is not None and client.is_connected:
+            await client.disconnect()
+
+    async def disconnect(self) -> None:
+        """Disconnect from the device if a connection is still open."""
+        async with self._client_lock:
+            await self._disconnect()
 
     async def _get_status(
         self, client: BleakClient, device: BlueConnectGoDevice
@@ -55,65 +176,74 @@ class BlueConnectGoBluetoothDeviceData:
         _LOGGER.debug("Getting Status")
 
         data_ready_event = Event()
-
-        await client.start_notify(
-            NOTIFY_CHAR_UUID, partial(self._receive_status, device, data_ready_event)
-        )
-        await client.write_gatt_char(BUTTON_CHAR_UUID, b"\x01", response=True)
-        _LOGGER.debug("Write sent")
+        self._pending = (device, data_ready_event)
 
         try:
-            await asyncio.wait_for(data_ready_event.wait(), timeout=NOTIFY_TIMEOUT)
-        except TimeoutError:
-            _LOGGER.warning("Timer expired")
+            await client.write_gatt_char(BUTTON_CHAR_UUID, b"\x01", response=True)
+            _LOGGER.debug("Write sent")
+
+            try:
+                await asyncio.wait_for(data_ready_event.wait(), timeout=NOTIFY_TIMEOUT)
+            except TimeoutError:
+                _LOGGER.warning("Timer expired")
+                _clear_readings(device)
+        finally:
+            self._pending = None
 
         _LOGGER.debug("Status acquisition finished")
         return device
 
-    async def _receive_status(
+    def _receive_status(
         self,
-        device: BlueConnectGoDevice,
-        data_ready_event: Event,
         char_specifier: str,
         data: bytearray,
     ) -> None:
         _LOGGER.debug("Got new data")
-        data_ready_event.set()
 
-        _LOGGER.debug(
-            f"  -> frame array hex: {":".join([f"{byte:02X}" for byte in data])}"  # noqa: G004
-        )
+        if self._pending is None:
+            _LOGGER.debug("No status request pending, ignoring data")
+            return
+        device, data_ready_event = self._pending
 
-        # TODO: All these readings need to be reviewed and improved
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("  -> frame array hex: %s", data.hex(":").upper())
 
-        raw_temp = int.from_bytes(data[1:3], byteorder="little")
-        device.sensors["temperature"] = raw_temp / 100.0
-
-        raw_ph = int.from_bytes(data[3:5], byteorder="little")
-        device.sensors["pH"] = (2048 - raw_ph) / 232.0 + 7.0
+        if len(data) < 1 + _STATUS_FRAME.size:
+            _LOGGER.warning(
+                "Ignoring short status frame: got %d bytes, expected %d",
+                len(data),
+                1 + _STATUS_FRAME.size,
+            )
+            _clear_readings(device)
+            data_ready_event.set()
+            return
 
-        raw_orp = int.from_bytes(data[5:7], byteorder="little")
-        # device.sensors["ORP"] = raw_orp / 3.86 - 21.57826
-        device.sensors["ORP"] = raw_orp / 4.0 - 5.0
-        device.sensors["chlorine"] = (raw_orp / 4.0 - 5.0 - 650.0) / 200.0 * 10.0
+        (
+            temperature,
+            ph,
+            orp,
+            chlorine,
+            ec,
+            salt,
+            battery_voltage,
+        ) = _parse_status_frame(data)
 
-        raw_cond = int.from_bytes(data[7:9], byteorder="little")
-        if raw_cond != 0:
-            device.sensors["EC"] = 1.0 / (raw_cond * 0.000001) * 1.0615
-            device.sensors["salt"] = 1.0 / (raw_cond * 0.001) * 1.0615 * 500.0 / 1000.0
-        else:
-            device.sensors["EC"] = None
-            device.sensors["salt"] = None
+        if battery_voltage != self._last_raw_batt:
+            self._last_raw_batt = battery_voltage
+            self._battery = _battery_percent(battery_voltage)
 
-        raw_batt = int.from_bytes(data[9:11], byteorder="little")
-        device.sensors["battery_voltage"] = raw_batt
-        BATT_MAX_MV = 3640
-        BATT_MIN_MV = 3400
-        batt_percent = (raw_batt - BATT_MIN_MV) / (BATT_MAX_MV - BATT_MIN_MV) * 100.0
-        device.sensors["battery"] = max(0, min(batt_percent * 100, 100))
+        sensors = device.sensors
+        sensors["temperature"] = temperature
+        sensors["pH"] = ph
+        sensors["ORP"] = orp
+        sensors["chlorine"] = chlorine
+        sensors["EC"] = ec
+        sensors["salt"] = salt
+        sensors["battery_voltage"] = battery_voltage
+        sensors["battery"] = self._battery
 
         _LOGGER.debug("Got Status")
-        return device
+        data_ready_event.set()
 
     async def update_device(
         self, ble_device: BLEDevice, skip_query=False
@@ -121,19 +251,28 @@ class BlueConnectGoBluetoothDeviceData:
         """Connect to the device through BLE and retrieves relevant data."""
         _LOGGER.debug("Update Device")
 
-        device = BlueConnectGoDevice()
-        device.name = ble_device.address
-        device.address = ble_device.address
-        _LOGGER.debug("device.name: %s", device.name)
-        _LOGGER.debug("device.address: %s", device.address)
+        device = self._device
+        if device is None or device.address != ble_device.address:
+            device = BlueConnectGoDevice(
+                name=ble_device.address, address=ble_device.address
+            )
+            self._device = device
+            _LOGGER.debug("device.name: %s", device.name)
+            _LOGGER.debug("device.address: %s", device.address)
 
         if not skip_query:
-            client = await establish_connection(
-                BleakClient, ble_device, ble_device.address
-            )
-            _LOGGER.debug("Got Client")
-            await self._get_status(client, device)
-            _LOGGER.debug("got Status")
-            await client.disconnect()
+            async with self._client_lock:
+                self._cancel_disconnect_timer()
+                try:
+                    client = await self._ensure_connected(ble_device)
+                    await self._get_status(client, device)
+                except Exception:
+                    await self._disconnect()
+                    raise
+                finally:
+                    # Covers cancellation too: an open link always gets closed
+                    if self._client is not None:
+                        self._schedule_disconnect()
+                _LOGGER.debug("got Status")
 
         return device
@@ -7,14 +7,17 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.components.bluetooth import async_ble_device_from_address
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator, UpdateFailed
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .BlueConnectGo import BlueConnectGoDevice, BlueConnectGoBluetoothDeviceData
+from .BlueConnectGo import BlueConnectGoDevice
 from .const import DOMAIN
+from .coordinator import BlueConnectCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNIQUE_ID_TRANSLATION = str.maketrans({":": "_", " ": "_"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,22 +26,41 @@ async def async_setup_entry(
 ) -> None:
     """Set up the BlueConnect Go button."""
     
-    coordinator: DataUpdateCoordinator[BlueConnectGoDevice] = hass.data[DOMAIN][
-        entry.entry_id
-    ]
+    coordinator: BlueConnectCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    device = coordinator.data
+    device_name = device.name or "BlueConnect"
+    name = f"{device_name} {device.identifier}"
+    device_info = DeviceInfo(
+        connections={
+            (
+                "bluetooth",
+                device.address,
+            )
+        },
+        name=name,
+        manufacturer="Blue Riiot",
+        model="Blue Connect Go",
+        hw_version=device.hw_version,
+        sw_version=device.sw_version,
+    )
 
     async_add_entities([
-        TakeMeasurementImmediately(coordinator, coordinator.data, hass, entry),
+        TakeMeasurementImmediately(
+            coordinator, coordinator.data, name, device_info, hass, entry
+        ),
     ])
 
 
 class TakeMeasurementImmediately(
-    CoordinatorEntity[DataUpdateCoordinator[BlueConnectGoDevice]], ButtonEntity
+    CoordinatorEntity[BlueConnectCoordinator], ButtonEntity
 ):
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: BlueConnectCoordinator,
         blueconnect_go_device: BlueConnectGoDevice,
+        name: str,
+        device_info: DeviceInfo,
         hass: HomeAssistant,
         entry: ConfigEntry,
     ) -> None:
@@ -48,42 +70,28 @@ class TakeMeasurementImmediately(
         self.entry = entry
         self.device = blueconnect_go_device
 
-        device_name = blueconnect_go_device.name or "BlueConnect"
-        name = f"{device_name} {blueconnect_go_device.identifier}"
-
-        self._attr_unique_id = f"{name}_take_measurement".lower().replace(":", "_").replace(" ", "_")
+        self._attr_unique_id = (
+            f"{name}_take_measurement".lower().translate(_UNIQUE_ID_TRANSLATION)
+        )
         self._attr_name = "Take Measurement"
         self._id = blueconnect_go_device.address
-        self._attr_device_info = DeviceInfo(
-            connections={
-                (
-                    "bluetooth",
-                    blueconnect_go_device.address,
-                )
-            },
-            name=name,
-            manufacturer="Blue Riiot",
-            model="Blue Connect Go",
-            hw_version=blueconnect_go_device.hw_version,
-            sw_version=blueconnect_go_device.sw_version,
-        )
+        self._attr_device_info = device_info
 
     async def async_press(self) -> None:
         """Trigger a measurement via Bluetooth."""
-        _LOGGER.info(f"Button pressed: starting measurement for {self.device.name} ({self.device.address})")
-
-        ble_device = async_ble_device_from_address(self.hass, self.device.address)
-        if not ble_device:
-            _LOGGER.error(f"No Bluetooth device found at address {self.device.address}")
-            raise UpdateFailed("Bluetooth device not found")
+        _LOGGER.debug(
+            "Button pressed: starting measurement for %s (%s)",
+            self.device.name,
+            self.device.address,
+        )
 
-        bcgo = BlueConnectGoBluetoothDeviceData(_LOGGER)
+        self.coordinator.reset_update_interval()
+        await self.coordinator.async_refresh()
 
-        try:
-            data = await bcgo.update_device(ble_device)
-            _LOGGER.info("Measurement taken successfully.")
-            self.coordinator.async_set_updated_data(data)
-            _LOGGER.info("Coordinator has been updated.")
-        except Exception as err:
-            _LOGGER.error(f"Error while reading data: {err}")
-            raise UpdateFailed(f"Error while reading data: {err}") from err
+        if not self.coordinator.last_update_success:
+            raise HomeAssistantError(
+                f"Error while reading data: {self.coordinator.last_exception}"
+            )
+        if self.coordinator.consecutive_failures:
+            raise HomeAssistantError(f"No readings received from {self.device.address}")
+        _LOGGER.debug("Measurement taken successfully.")
@@ -14,12 +14,13 @@ from homeassistant.components.bluetooth import (
     BluetoothServiceInfo,
     async_discovered_service_info,
 )
-from homeassistant.config_entries import ConfigFlow
-from homeassistant.const import CONF_ADDRESS
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
+from homeassistant.const import CONF_ADDRESS, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .BlueConnectGo import BlueConnectGoBluetoothDeviceData, BlueConnectGoDevice
-from .const import DOMAIN
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, MIN_SCAN_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +54,12 @@ class BCGoConfigFlow(ConfigFlow, domain=DOMAIN):
         self._discovered_device: Discovery | None = None
         self._discovered_devices: dict[str, Discovery] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return BCGoOptionsFlow(config_entry)
+
     async def _get_device_data(
         self, discovery_info: BluetoothServiceInfo
     ) -> BlueConnectGoDevice:
@@ -151,10 +158,10 @@ class BCGoConfigFlow(ConfigFlow, domain=DOMAIN):
 
             ##
             if not address.startswith("00:A0"):
-                _LOGGER.info(f"Skipping device: {address}")  # noqa: G004
+                _LOGGER.debug("Skipping device: %s", address)
                 continue
 
-            _LOGGER.info(f"Found BlueConnect Go Device: {address}")  # noqa: G004
+            _LOGGER.debug("Found BlueConnect Go Device: %s", address)
             _LOGGER.debug("BCGo Discovery address: %s", address)
             _LOGGER.debug("BCGo Man Data: %s", discovery_info.manufacturer_data)
             _LOGGER.debug("BCGo advertisement: %s", discovery_info.advertisement)
@@ -193,3 +200,32 @@ class BCGoConfigFlow(ConfigFlow, domain=DOMAIN):
                 },
             ),
         )
+
+
+class BCGoOptionsFlow(OptionsFlow):
+    """Handle Blue Connect Go options."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling interval."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=self._entry.options.get(
+                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)),
+                }
+            ),
+        )
@@ -3,3 +3,8 @@
 DOMAIN = "blueconnect"
 
 DEFAULT_SCAN_INTERVAL = 1800
+MIN_SCAN_INTERVAL = 60
+# Polling slows down up to this interval, in seconds, while readings are static
+MAX_SCAN_INTERVAL = 7200
+# Identical consecutive readings after which the polling interval is doubled
+UNCHANGED_POLLS_BEFORE_BACKOFF = 3
@@ -0,0 +1,96 @@
+"""Data update coordinator for BlueConnect Go BLE devices."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+
+from homeassistant.components import bluetooth
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .BlueConnectGo import BlueConnectGoBluetoothDeviceData, BlueConnectGoDevice
+from .const import DOMAIN, MAX_SCAN_INTERVAL, UNCHANGED_POLLS_BEFORE_BACKOFF
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BlueConnectCoordinator(DataUpdateCoordinator[BlueConnectGoDevice]):
+    """Coordinator polling a BlueConnect Go device over BLE.
+
+    The polling interval doubles, up to MAX_SCAN_INTERVAL, every time the
+    device reports the same readings UNCHANGED_POLLS_BEFORE_BACKOFF times in a
+    row, and returns to the configured interval as soon as a reading changes or
+    a poll fails to get any readings.
+    """
+
+    def __init__(self, hass: HomeAssistant, address: str, scan_interval: int) -> None:
+        """Initialize the coordinator."""
+        self._base_interval = timedelta(seconds=scan_interval)
+        self._max_interval = timedelta(seconds=max(scan_interval, MAX_SCAN_INTERVAL))
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=self._base_interval,
+        )
+        self.address = address
+        self.bcgo = BlueConnectGoBluetoothDeviceData(_LOGGER)
+        self._last_sensors: dict[str, str | float | None] = {}
+        self._identical_polls = 0
+        self._consecutive_failures = 0
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Return how many polls in a row got no readings from the device."""
+        return self._consecutive_failures
+
+    @callback
+    def reset_update_interval(self) -> None:
+        """Go back to polling at the configured interval."""
+        self._identical_polls = 0
+        self.update_interval = self._base_interval
+
+    def _record_failure(self) -> None:
+        self._consecutive_failures += 1
+        _LOGGER.debug("Poll failed (%d in a row)", self._consecutive_failures)
+        self._last_sensors = {}
+        self.reset_update_interval()
+
+    def _adjust_update_interval(self, sensors: dict[str, str | float | None]) -> None:
+        if all(value is None for value in sensors.values()):
+            # The device did not answer in time, so there is nothing to compare
+            self._record_failure()
+            return
+
+        self._consecutive_failures = 0
+        if sensors != self._last_sensors:
+            self._last_sensors = dict(sensors)
+            self.reset_update_interval()
+
+        self._identical_polls += 1
+        if self._identical_polls < UNCHANGED_POLLS_BEFORE_BACKOFF:
+            return
+
+        self._identical_polls = 0
+        self.update_interval = min(self.update_interval * 2, self._max_interval)
+        _LOGGER.debug("Readings unchanged, polling every %s", self.update_interval)
+
+    async def _async_update_data(self) -> BlueConnectGoDevice:
+        """Get data from BlueConnect Go BLE."""
+        _LOGGER.debug("async_update_data")
+        ble_device = bluetooth.async_ble_device_from_address(self.hass, self.address)
+        if not ble_device:
+            self._record_failure()
+            raise UpdateFailed(
+                f"Could not find BlueConnect Go device with address {self.address}"
+            )
+
+        try:
+            data = await self.bcgo.update_device(ble_device)
+        except Exception as err:
+            self._record_failure()
+            raise UpdateFailed(f"Unable to fetch data: {err}") from err
+
+        self._adjust_update_interval(data.sensors)
+        return data
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 
 from homeassistant import config_entries
@@ -18,22 +19,19 @@ from homeassistant.const import (
     UnitOfElectricPotential,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .BlueConnectGo import BlueConnectGoDevice
 from .const import DOMAIN
+from .coordinator import BlueConnectCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSORS_MAPPING_TEMPLATE: dict[str, SensorEntityDescription] = {
+SENSORS_MAPPING_TEMPLATE: Mapping[str, SensorEntityDescription] = {
     "EC": SensorEntityDescription(
         key="EC",
         name="Electrical Conductivity",
@@ -104,6 +102,8 @@ SENSORS_MAPPING_TEMPLATE: dict[str, SensorEntityDescription] = {
     ),
 }
 
+_KNOWN_SENSOR_KEYS = frozenset(SENSORS_MAPPING_TEMPLATE)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -112,14 +112,26 @@ async def async_setup_entry(
 ) -> None:
     """Set up the BlueConnect Go BLE sensors."""
 
-    coordinator: DataUpdateCoordinator[BlueConnectGoDevice] = hass.data[DOMAIN][
-        entry.entry_id
-    ]
-    sensors_mapping = SENSORS_MAPPING_TEMPLATE.copy()
+    coordinator: BlueConnectCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device = coordinator.data
+    name = f"{device.name} {device.identifier}"
+    device_info = DeviceInfo(
+        connections={
+            (
+                CONNECTION_BLUETOOTH,
+                device.address,
+            )
+        },
+        name=name,
+        manufacturer="Blue Riiot",
+        model="Blue Connect Go",
+        hw_version=device.hw_version,
+        sw_version=device.sw_version,
+    )
     entities = []
     _LOGGER.debug("got sensors: %s", coordinator.data.sensors)
     for sensor_type, sensor_value in coordinator.data.sensors.items():
-        if sensor_type not in sensors_mapping:
+        if sensor_type not in _KNOWN_SENSOR_KEYS:
             _LOGGER.debug(
                 "Unknown sensor type detected: %s, %s",
                 sensor_type,
@@ -128,16 +140,14 @@ async def async_setup_entry(
             continue
         entities.append(
             BlueConnectSensor(
-                coordinator, coordinator.data, sensors_mapping[sensor_type]
+                coordinator, name, device_info, SENSORS_MAPPING_TEMPLATE[sensor_type]
             )
         )
 
     async_add_entities(entities)
 
 
-class BlueConnectSensor(
-    CoordinatorEntity[DataUpdateCoordinator[BlueConnectGoDevice]], SensorEntity
-):
+class BlueConnectSensor(CoordinatorEntity[BlueConnectCoordinator], SensorEntity):
     """BlueConnect Go BLE sensors for the device."""
 
     # _attr_state_class = SensorStateClass.MEASUREMENT
@@ -145,37 +155,39 @@ class BlueConnectSensor(
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
-        blueconnect_go_device: BlueConnectGoDevice,
+        coordinator: BlueConnectCoordinator,
+        name: str,
+        device_info: DeviceInfo,
         entity_description: SensorEntityDescription,
     ) -> None:
         """Populate the BlueConnect Go entity with relevant data."""
         super().__init__(coordinator)
         self.entity_description = entity_description
+        self._key = entity_description.key
+        self._last_written_state: tuple[bool, StateType] | None = None
 
-        name = f"{blueconnect_go_device.name} {blueconnect_go_device.identifier}"
-
-        self._attr_unique_id = f"{name}_{entity_description.key}"
-
-        self._id = blueconnect_go_device.address
-        self._attr_device_info = DeviceInfo(
-            connections={
-                (
-                    CONNECTION_BLUETOOTH,
-                    blueconnect_go_device.address,
-                )
-            },
-            name=name,
-            manufacturer="Blue Riiot",
-            model="Blue Connect Go",
-            hw_version=blueconnect_go_device.hw_version,
-            sw_version=blueconnect_go_device.sw_version,
-        )
+        self._attr_unique_id = f"{name}_{self._key}"
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
-        try:
-            return self.coordinator.data.sensors[self.entity_description.key]
-        except KeyError:
-            return None
+        return self.coordinator.data.sensors.get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the reading or availability changed."""
+        if (self.available, self.native_value) == self._last_written_state:
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was written."""
+        self._last_written_state = (self.available, self.native_value)
+        super().async_write_ha_state()
+
+    async def async_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Update the state and remember what was written."""
+        await super().async_update_ha_state(force_refresh)
+        self._last_written_state = (self.available, self.native_value)